@@ -0,0 +1,80 @@
+# Benchmark: columnar fetch vs. the list-of-dicts path.
+# Run from the repo root:
+#   python bench/columnar_bench.py [--rows 1000000] [--batch-size 65536] > bench_output.txt
+#
+# Setup: one table (id INT, x FLOAT, b BOOL); row i = (i, i * 0.5, i % 2 == 0),
+# with b NULL on every 10th row. Rows are loaded through HeapTable.insert
+# (schema validation included) rather than SQL, since parsing 1M INSERTs
+# would dominate the run.
+#
+# Paths compared (all end with typed per-column buffers):
+#   dict      execute(), then copy each column into an array.array
+#   columnar  execute_columnar()
+#   stream    fetch_columns(batch_size), consuming each batch
+# Each path is timed without tracing, then run again under tracemalloc to
+# report peak Python heap allocations.
+
+from __future__ import annotations
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from mini_db.api import Database  # noqa: E402
+
+SQL = "SELECT * FROM t"
+
+def load(n: int) -> Database:
+    db = Database()
+    db.execute("CREATE TABLE t (id INT, x FLOAT, b BOOL)")
+    heap = db.heaps["t"]
+    for i in range(n):
+        heap.insert({"id": i, "x": i * 0.5, "b": None if i % 10 == 0 else i % 2 == 0})
+    return db
+
+def dict_path(db: Database, _batch_size: int):
+    rows = db.execute(SQL)[0]
+    cols = {}
+    for name, tc in (("id", "q"), ("x", "d"), ("b", "b")):
+        vals = [r[name] for r in rows]
+        valid = bytearray(v is not None for v in vals)
+        cols[name] = (array(tc, [0 if v is None else v for v in vals]), valid)
+    return cols
+
+def columnar_path(db: Database, _batch_size: int):
+    return db.execute_columnar(SQL)[0]
+
+def stream_path(db: Database, batch_size: int):
+    n = 0
+    for batch in db.fetch_columns(SQL, batch_size=batch_size):
+        n += len(batch)
+    return n
+
+def main():
+    ap = argparse.ArgumentParser(description="Columnar fetch vs. list-of-dicts benchmark")
+    ap.add_argument("--rows", type=int, default=1_000_000)
+    ap.add_argument("--batch-size", type=int, default=65536)
+    args = ap.parse_args()
+
+    t = time.perf_counter()
+    db = load(args.rows)
+    print(f"loaded {args.rows} rows in {time.perf_counter() - t:.2f}s")
+    print(f"python {sys.version.split()[0]}, batch_size={args.batch_size}")
+
+    for name, fn in (("dict", dict_path), ("columnar", columnar_path), ("stream", stream_path)):
+        t = time.perf_counter()
+        res = fn(db, args.batch_size)
+        elapsed = time.perf_counter() - t
+        del res
+        tracemalloc.start()
+        res = fn(db, args.batch_size)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del res
+        print(f"{name:<9} {elapsed:6.2f}s  peak {peak / 1e6:7.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,17 @@
 # db = Database("./data")
 # db.execute("INSERT INTO users VALUES (1, 'Alice')")
 # rows = db.execute("SELECT * FROM users")
+# cols = db.execute_columnar("SELECT * FROM users")[0]   # ColumnBatch
+# for batch in db.fetch_columns("SELECT * FROM users", batch_size=65536): ...
 
 from __future__ import annotations
-from typing import Any, List
+from typing import Any, Iterator, List
 from .schema import Catalog
 from .storage.heap import HeapTable
 from .sql.parser import Parser
-from .sql.executor import ExecutionContext, exec_stmt
+from .sql.ast_nodes import Select
+from .sql.executor import ExecutionContext, exec_select_columnar, exec_stmt
+from .columnar import ColumnBatch
 
 class Database:
     """
@@ -37,3 +41,34 @@ class Database:
             res = exec_stmt(ctx, s)  # execute AST statement
             results.append(res)
         return results
+
+    def execute_columnar(self, sql: str) -> List[Any]:
+        """
+        Like execute(), but SELECT results come back as a ColumnBatch
+        (one typed buffer per column) instead of a list of dicts.
+        Other statements return the same results as execute().
+        """
+        parser = Parser(sql)
+        stmts = parser.parse()
+        ctx = ExecutionContext(self.catalog, self.heaps)
+        results = []
+        for s in stmts:
+            if isinstance(s, Select):
+                results.append(exec_select_columnar(ctx, s))
+            else:
+                results.append(exec_stmt(ctx, s))
+        return results
+
+    def fetch_columns(self, sql: str, batch_size: int = 65536) -> Iterator[ColumnBatch]:
+        """
+        Stream a single SELECT as ColumnBatch objects of at most batch_size rows,
+        so memory stays bounded by the batch rather than the whole result.
+        Batches are built lazily from the live table while iterating; this is
+        not a snapshot: rows inserted before the scan reaches the end of the
+        table show up in later batches.
+        """
+        stmts = Parser(sql).parse()
+        if len(stmts) != 1 or not isinstance(stmts[0], Select):
+            raise ValueError("fetch_columns expects exactly one SELECT statement")
+        ctx = ExecutionContext(self.catalog, self.heaps)
+        return exec_select_columnar(ctx, stmts[0], batch_size)
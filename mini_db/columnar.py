@@ -0,0 +1,182 @@
+# Columnar result sets for analytics consumers (NumPy / pandas).
+# Instead of one dict per row in the result, a SELECT can be materialized as
+# one typed, contiguous buffer per column (array.array) plus an optional
+# validity mask. Heap rows are still dicts, so each column's values are first
+# gathered into a temporary list and then packed into the array.
+# The buffers support the buffer protocol, so memoryview(col.data) and
+# numpy.frombuffer(col.data) see the same memory without copying it.
+
+from __future__ import annotations
+from array import array
+from typing import Dict, Iterable, Iterator, List, Sequence
+from .types import Column, DBType
+
+# Storage typecode per column type. TEXT has no fixed-width layout, so it
+# stays a plain list of Python strings. INT/FLOAT values that do not fit the
+# typecode (Python ints are unbounded) make the column fall back to a list too.
+TYPECODES: Dict[DBType, str] = {
+    DBType.INT: "q",    # signed 64-bit
+    DBType.FLOAT: "d",  # 64-bit double
+    DBType.BOOL: "b",   # 0 / 1 per row
+}
+
+# Matching NumPy dtypes (used by to_numpy()).
+NUMPY_DTYPES: Dict[DBType, str] = {
+    DBType.INT: "int64",
+    DBType.FLOAT: "float64",
+    DBType.BOOL: "bool",
+}
+
+class ColumnVector:
+    """
+    One column of a result set.
+    - data: array.array for INT/FLOAT/BOOL, list for TEXT or for INT/FLOAT
+      columns whose values overflow the typecode
+    - validity: bytearray with 1 = value, 0 = NULL; None when there are no NULLs
+    NULL slots hold 0 (or "" for TEXT) in `data`.
+    """
+
+    def __init__(self, name: str, dtype: DBType, data, validity: bytearray | None = None):
+        self.name = name
+        self.dtype = dtype
+        self.data = data
+        self.validity = validity
+
+    @classmethod
+    def from_values(cls, col: Column, name: str, values: List[object]) -> "ColumnVector":
+        """Build a column from a list of Python values (None = NULL)."""
+        validity = None
+        if None in values:
+            # Only pay for a mask when the column actually contains NULLs
+            validity = bytearray(v is not None for v in values)
+            fill = "" if col.dtype == DBType.TEXT else 0
+            values = [fill if v is None else v for v in values]
+        tc = TYPECODES.get(col.dtype)
+        data = values
+        if tc is not None:
+            try:
+                data = array(tc, values)
+            except OverflowError:
+                # e.g. INT beyond 64 bits, or an int too large for a double:
+                # keep the exact Python values as an object column
+                pass
+        return cls(name, col.dtype, data, validity)
+
+    @property
+    def is_typed(self) -> bool:
+        """True when `data` is an array.array (supports the buffer protocol)."""
+        return isinstance(self.data, array)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, i: int):
+        if self.validity is not None and not self.validity[i]:
+            return None
+        v = self.data[i]
+        return bool(v) if self.dtype == DBType.BOOL and self.is_typed else v
+
+    @property
+    def null_count(self) -> int:
+        if self.validity is None:
+            return 0
+        return len(self.validity) - sum(self.validity)
+
+    def to_list(self) -> List[object]:
+        """Return the column as Python values (NULL → None)."""
+        return [self[i] for i in range(len(self))]
+
+    def to_numpy(self):
+        """
+        Return a NumPy view of the column.
+        - INT/FLOAT/BOOL: zero-copy view over `data`
+        - TEXT and overflowed INT/FLOAT: object array (copy)
+        Columns with NULLs come back as a numpy.ma.MaskedArray.
+        Requires numpy to be installed.
+        """
+        import numpy as np  # optional dependency
+        if not self.is_typed:
+            values = np.array(self.data, dtype=object)
+        else:
+            values = np.frombuffer(self.data, dtype=NUMPY_DTYPES[self.dtype])
+        if self.validity is None:
+            return values
+        valid = np.frombuffer(self.validity, dtype=bool)
+        return np.ma.MaskedArray(values, mask=~valid)
+
+class ColumnBatch:
+    """
+    A columnar result set (or one batch of it when streaming).
+    Columns keep the SELECT's projection order.
+    """
+
+    def __init__(self, columns: Sequence[ColumnVector], num_rows: int):
+        self.columns: List[ColumnVector] = list(columns)
+        self.num_rows = num_rows
+
+    @classmethod
+    def from_rows(cls, cols: Sequence[tuple], rows: List[Dict[str, object]]) -> "ColumnBatch":
+        """
+        Build a batch from row dicts.
+        - cols: (output name, Column) pairs in projection order
+        - rows: stored heap rows
+        """
+        vectors = [
+            ColumnVector.from_values(col, name, [r.get(name) for r in rows])
+            for name, col in cols
+        ]
+        return cls(vectors, len(rows))
+
+    @property
+    def column_names(self) -> List[str]:
+        return [c.name for c in self.columns]
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __repr__(self) -> str:
+        return f"ColumnBatch({self.num_rows} rows, columns={self.column_names})"
+
+    def column(self, name: str) -> ColumnVector:
+        """Look up a column by name (case-insensitive)."""
+        for c in self.columns:
+            if c.name.lower() == name.lower():
+                return c
+        raise KeyError(name)
+
+    __getitem__ = column
+
+    def to_pydict(self) -> Dict[str, List[object]]:
+        """Return {column name: list of values}."""
+        return {c.name: c.to_list() for c in self.columns}
+
+    def to_rows(self) -> List[Dict[str, object]]:
+        """
+        Return the result as a list of row dicts, like Database.execute.
+        Values are coerced to the column's declared type, so a bool stored in
+        an INT column comes back as 1/0 and an int in a FLOAT column as float.
+        """
+        lists = [c.to_list() for c in self.columns]
+        names = self.column_names
+        return [dict(zip(names, vals)) for vals in zip(*lists)]
+
+    def to_numpy(self) -> Dict[str, object]:
+        """Return {column name: numpy array} (see ColumnVector.to_numpy)."""
+        return {c.name: c.to_numpy() for c in self.columns}
+
+    def to_pandas(self):
+        """Return a pandas DataFrame. Requires pandas to be installed."""
+        import pandas as pd  # optional dependency
+        return pd.DataFrame(self.to_numpy(), columns=self.column_names)
+
+def iter_batches(cols: Sequence[tuple], rows: Iterable[Dict[str, object]],
+                 batch_size: int) -> Iterator[ColumnBatch]:
+    """Chunk `rows` into ColumnBatch objects of at most `batch_size` rows."""
+    chunk: List[Dict[str, object]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= batch_size:
+            yield ColumnBatch.from_rows(cols, chunk)
+            chunk = []
+    if chunk:
+        yield ColumnBatch.from_rows(cols, chunk)
@@ -2,10 +2,12 @@
 # Operators are iterators: SeqScan yields rows, Filter wraps it and filters, Project wraps and selects columns, etc.
 
 from __future__ import annotations
-from typing import Dict, Iterable, List
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
 from ..schema import Catalog, TableSchema
 from ..types import Column, DBType
 from ..storage.heap import HeapTable
+from ..columnar import ColumnBatch, iter_batches
 from .ast_nodes import CreateTable, Insert, Select
 
 # Holds runtime state (catalog + heap storage)
@@ -69,8 +71,37 @@ def _exec_select(ctx: ExecutionContext, s: Select):
     cols = col_order if s.projections is None else s.projections
     out: List[Dict[str, object]] = []
     for _, row in heap.scan():
-        proj = {c: row.get(c) for c in cols}   # projection (subset of columns)
-        out.append(proj)
         if s.limit is not None and len(out) >= s.limit:
             break
+        proj = {c: row.get(c) for c in cols}   # projection (subset of columns)
+        out.append(proj)
     return out
+
+# === SELECT (columnar) ===
+# Same scan as _exec_select, but instead of one projected dict per row the
+# values of each column are gathered into a list and packed into a typed array
+# (see ColumnBatch.from_rows). Without batch_size the scanned rows are collected
+# into a list first, so peak memory is bounded only when streaming.
+def exec_select_columnar(ctx: ExecutionContext, s: Select, batch_size: int | None = None):
+    """
+    - batch_size None → one ColumnBatch with the whole result
+    - batch_size N    → iterator of ColumnBatch objects of at most N rows
+    """
+    if batch_size is not None and batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    schema = ctx.catalog.get(s.table)
+    heap = ctx.heaps[s.table.lower()]
+    cmap = schema.column_map()
+    names = [c.name for c in schema.columns] if s.projections is None else s.projections
+    cols = []
+    for name in names:
+        col = cmap.get(name.lower())
+        if col is None:
+            raise ValueError(f"Unknown column '{name}'")
+        cols.append((name, col))
+    rows: Iterator[Dict[str, object]] = (row for _, row in heap.scan())
+    if s.limit is not None:
+        rows = islice(rows, s.limit)
+    if batch_size is None:
+        return ColumnBatch.from_rows(cols, list(rows))
+    return iter_batches(cols, rows, batch_size)
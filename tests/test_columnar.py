@@ -0,0 +1,116 @@
+import pytest
+from mini_db.api import Database
+
+SETUP = """
+CREATE TABLE t (id INT PRIMARY KEY, score FLOAT, flag BOOL, name TEXT);
+INSERT INTO t VALUES (1, 10, TRUE, 'a');
+INSERT INTO t (id, name) VALUES (2, 'b');
+INSERT INTO t VALUES (3, 30, FALSE, 'c');
+INSERT INTO t VALUES (4, 40, TRUE, 'd');
+INSERT INTO t VALUES (5, 50, FALSE, 'e');
+"""
+
+@pytest.fixture
+def db():
+    db = Database()
+    db.execute(SETUP)
+    return db
+
+@pytest.mark.parametrize("sql", [
+    "SELECT * FROM t",
+    "SELECT name, id FROM t",
+    "SELECT * FROM t LIMIT 0",
+    "SELECT id, flag FROM t LIMIT 3",
+])
+def test_to_rows_matches_execute(db, sql):
+    batch = db.execute_columnar(sql)[0]
+    assert batch.to_rows() == db.execute(sql)[0]
+    assert len(batch) == len(db.execute(sql)[0])
+
+def test_non_select_results_match_execute():
+    db = Database()
+    res = db.execute_columnar("CREATE TABLE u (id INT); INSERT INTO u VALUES (1)")
+    assert res == ["OK", "1 row inserted"]
+
+def test_validity_mask_only_with_nulls(db):
+    batch = db.execute_columnar("SELECT * FROM t")[0]
+    assert batch["id"].validity is None
+    assert batch["id"].null_count == 0
+    assert batch["name"].validity is None
+    assert batch["score"].validity == bytearray([1, 0, 1, 1, 1])
+    assert batch["score"].null_count == 1
+    assert batch["flag"].null_count == 1
+    assert batch["score"][1] is None
+
+def test_memoryview_over_int_column(db):
+    batch = db.execute_columnar("SELECT * FROM t")[0]
+    mv = memoryview(batch["id"].data)
+    assert mv.format == "q"
+    assert len(mv) == 5
+    assert mv.tolist() == [1, 2, 3, 4, 5]
+
+def test_fetch_columns_batches(db):
+    batches = list(db.fetch_columns("SELECT * FROM t", batch_size=2))
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert sum(len(b) for b in batches) == 5
+    rows = [r for b in batches for r in b.to_rows()]
+    assert rows == db.execute("SELECT * FROM t")[0]
+
+def test_fetch_columns_respects_limit(db):
+    batches = list(db.fetch_columns("SELECT id FROM t LIMIT 3", batch_size=2))
+    assert [len(b) for b in batches] == [2, 1]
+
+@pytest.mark.parametrize("sql, kwargs", [
+    ("SELECT * FROM t", {"batch_size": 0}),
+    ("SELECT * FROM t", {"batch_size": -1}),
+    ("SELECT * FROM t; SELECT id FROM t", {}),
+    ("INSERT INTO t VALUES (6, 60, TRUE, 'f')", {}),
+])
+def test_fetch_columns_rejects_bad_input(db, sql, kwargs):
+    with pytest.raises(ValueError):
+        db.fetch_columns(sql, **kwargs)
+
+def test_unknown_column(db):
+    with pytest.raises(ValueError):
+        db.execute_columnar("SELECT nope FROM t")
+
+def test_int_overflow_falls_back_to_object_column():
+    db = Database()
+    db.execute("CREATE TABLE big (id INT, b BOOL)")
+    db.execute("INSERT INTO big VALUES (99999999999999999999999, TRUE)")
+    sql = "SELECT * FROM big"
+    batch = db.execute_columnar(sql)[0]
+    assert not batch["id"].is_typed
+    assert batch["b"].is_typed
+    assert batch.to_rows() == db.execute(sql)[0]
+    (stream,) = db.fetch_columns(sql, batch_size=1)
+    assert stream.to_rows() == db.execute(sql)[0]
+
+def test_float_overflow_falls_back_to_object_column():
+    db = Database()
+    db.execute("CREATE TABLE f (x FLOAT)")
+    db.heaps["f"].insert({"x": 10**400})  # no float literals in the parser
+    db.heaps["f"].insert({"x": None})
+    col = db.execute_columnar("SELECT x FROM f")[0]["x"]
+    assert not col.is_typed
+    assert col.to_list() == [10**400, None]
+
+def test_to_numpy():
+    np = pytest.importorskip("numpy")
+    db = Database()
+    db.execute(SETUP)
+    batch = db.execute_columnar("SELECT * FROM t")[0]
+    ids = batch["id"].to_numpy()
+    assert ids.dtype == np.int64
+    assert np.shares_memory(ids, np.frombuffer(batch["id"].data, dtype=np.int64))
+    score = batch["score"].to_numpy()
+    assert isinstance(score, np.ma.MaskedArray)
+    assert score.mask.tolist() == [False, True, False, False, False]
+
+def test_to_pandas():
+    pytest.importorskip("pandas")
+    db = Database()
+    db.execute(SETUP)
+    df = db.execute_columnar("SELECT id, name FROM t")[0].to_pandas()
+    assert list(df.columns) == ["id", "name"]
+    assert df["id"].tolist() == [1, 2, 3, 4, 5]